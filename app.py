@@ -5,7 +5,7 @@ import logging
 from datetime import datetime
 
 from chatbot import get_response
-from models import User, get_db_connection
+from models import User, get_db_connection, close_db_connection
 from config import config
 from dotenv import load_dotenv
 from blueprints import blueprints
@@ -44,6 +44,9 @@ login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = 'auth.login'
 
+# Release the per-request database connection
+app.teardown_appcontext(close_db_connection)
+
 @login_manager.user_loader
 def load_user(user_id):
     return User.get(user_id)
@@ -7,7 +7,7 @@ from datetime import datetime
 import re
 
 from models import get_db_connection
-from plagiarism_checker import check_abstract_plagiarism, update_submission_plagiarism_score
+from plagiarism_checker import check_abstract_plagiarism, update_submission_plagiarism_score, compute_abstract_fingerprint
 
 abstracts_bp = Blueprint('abstracts', __name__, url_prefix='/abstracts')
 
@@ -133,6 +133,9 @@ def submit_abstract(event_id):
                     conn.close()
                     return render_template('submit_abstract.html', event=event, existing_submission=existing_submission, team=team)
         
+        # Phrase fingerprint used by the plagiarism checker's overlap prefilter
+        minhash = compute_abstract_fingerprint(abstract_text)
+        
         try:
             if existing_submission:
                 new_version = existing_submission['version'] + 1
@@ -144,10 +147,10 @@ def submit_abstract(event_id):
                 conn.execute("""
                     INSERT INTO abstract_submissions 
                     (event_id, team_id, user_id, title, abstract_text, file_path, file_name, 
-                     file_size, word_count, status, version, is_latest_version)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 'draft', ?, 1)
+                     file_size, word_count, minhash, status, version, is_latest_version)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'draft', ?, 1)
                 """, (event_id, team['id'] if team else None, current_user.id, title, 
-                      abstract_text, file_path, file_name, file_size, word_count, new_version))
+                      abstract_text, file_path, file_name, file_size, word_count, minhash, new_version))
                 submission_id = conn.lastrowid
                 conn.execute("""
                     INSERT INTO abstract_submission_history 
@@ -161,10 +164,10 @@ def submit_abstract(event_id):
                 conn.execute("""
                     INSERT INTO abstract_submissions 
                     (event_id, team_id, user_id, title, abstract_text, file_path, file_name, 
-                     file_size, word_count, status, version, is_latest_version)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 'draft', 1, 1)
+                     file_size, word_count, minhash, status, version, is_latest_version)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'draft', 1, 1)
                 """, (event_id, team['id'] if team else None, current_user.id, title, 
-                      abstract_text, file_path, file_name, file_size, word_count))
+                      abstract_text, file_path, file_name, file_size, word_count, minhash))
                 
                 flash('Abstract saved as draft! You can continue editing until you submit.', 'success')
             
@@ -20,6 +20,13 @@ def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def invalidate_user_by_email(conn, email):
+    """Drop the cached User for an email after updating its row"""
+    row = conn.execute("SELECT id FROM users WHERE email = ?", (email,)).fetchone()
+    if row:
+        User.invalidate(row['id'])
+
+
 @auth_bp.route('/signup', methods=['GET', 'POST'])
 def signup():
     if request.method == 'POST':
@@ -103,6 +110,7 @@ def verify_otp():
                     (new_email, otp, session.get('email'))
                 )
                 conn.commit()
+                invalidate_user_by_email(conn, new_email)
 
                 # Update session and resend OTP
                 session['email'] = new_email
@@ -132,6 +140,7 @@ def verify_otp():
                     (True, session.get('email'))
                 )
                 conn.commit()
+                invalidate_user_by_email(conn, session.get('email'))
                 conn.close()
                 flash('Email verified successfully! You can now log in.', 'success')
                 return redirect(url_for('auth.login'))
@@ -155,6 +164,7 @@ def resend_otp():
         (otp, email)
     )
     conn.commit()
+    invalidate_user_by_email(conn, email)
     conn.close()
 
     session['otp'] = otp
@@ -192,6 +202,7 @@ def login():
                 )
                 conn.commit()
                 conn.close()
+                User.invalidate(user.id)
                 flash(f'Welcome back, {user.username}!', 'success')
                 return redirect(url_for('main.dashboard'))
             else:
@@ -250,6 +261,7 @@ def profile():
                     (username, email, full_name, bio, profile_pic_path, current_user.id)
                 )
                 conn.commit()
+                User.invalidate(current_user.id)
                 current_app.logger.info("Profile updated successfully")
                 flash('Profile updated successfully!', 'success')
             except Exception as e:
@@ -329,6 +341,7 @@ def change_password():
     conn.execute('UPDATE users SET password = ? WHERE id = ?', (hashed_password, current_user.id))
     conn.commit()
     conn.close()
+    User.invalidate(current_user.id)
 
     flash('Password updated successfully!', 'success')
     return redirect(url_for('auth.profile'))
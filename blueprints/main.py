@@ -1,4 +1,4 @@
-from flask import Blueprint, render_template, redirect, url_for, flash
+from flask import Blueprint, render_template, request, redirect, url_for, flash, abort
 from flask_login import login_required, current_user
 from models import get_db_connection
 
@@ -186,3 +186,32 @@ def dashboard():
             upcoming_events=upcoming_events,
             recommended_events=recommended_events
         )
+
+@main_bp.route('/admin/vacuum', methods=['POST'])
+@login_required
+def incremental_vacuum():
+    """Release free pages back to the filesystem (admin only)"""
+    if current_user.role != 'admin':
+        flash('Unauthorized access.', 'danger')
+        return redirect(url_for('main.dashboard'))
+    
+    pages = request.form.get('pages', 1000, type=int)
+    # incremental_vacuum(0) would free every page, so require a positive count
+    if pages < 1:
+        abort(400)
+    
+    conn = get_db_connection()
+    try:
+        freelist_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        # execute() resets the pragma after one step, freeing a single page, so it
+        # is run through executescript(). That would first commit any open
+        # transaction on the shared connection, so refuse rather than do that.
+        if conn.in_transaction:
+            abort(409)
+        conn.executescript(f"PRAGMA incremental_vacuum({pages});")
+        freelist_after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    finally:
+        conn.close()
+    
+    flash(f'Reclaimed {freelist_before - freelist_after} free page(s).', 'success')
+    return redirect(url_for('main.dashboard'))
@@ -132,8 +132,6 @@ def _get_upcoming_events(limit=5):
         return rows
     except Exception:
         return []
-    finally:
-        conn.close()
 
 
 def get_response(user_query):
@@ -108,6 +108,7 @@ def cleanup_project():
         "forms.py",
         "chatbot.py",
         "plagiarism_checker.py",
+        "plagiarism_kernels.py",
         "init_db.py",
         "database.db",
         "requirements.txt",
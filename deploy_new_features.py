@@ -4,21 +4,99 @@ Deployment Script for Abstract Submission and Team Management Features
 CampusConnect+ Event Management System
 """
 
-import os
 import sys
+
+if sys.version_info < (3, 10):
+    sys.exit("❌ Python 3.10+ is required")
+
+import os
 import sqlite3
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+DEPLOY_STAMP = '.deploy_ok'
+BLUEPRINTS_DIR = 'blueprints'
+
+USAGE_INSTRUCTIONS = """
+============================================================
+🎉 DEPLOYMENT COMPLETED SUCCESSFULLY!
+============================================================
+
+📋 NEXT STEPS:
+
+1. Start the application:
+   python app.py
+
+2. Access the application:
+   http://localhost:5000
+
+3. Test new features:
+   • Create or join teams for events
+   • Submit abstracts for hackathons/competitions
+   • Review submissions as event manager
+   • Export reports and analytics
+
+4. Default accounts:
+   • Admin: admin/admin123
+   • Event Manager: manager1/manager123
+   • Students: john_doe/student123, jane_smith/student123
+
+📚 Documentation:
+   • See ABSTRACT_TEAM_FEATURES.md for detailed documentation
+   • Check application logs for any issues
+
+🔧 Configuration:
+   • Modify event requirements in the admin panel
+   • Adjust plagiarism thresholds as needed
+   • Configure email settings for notifications
+
+============================================================
+"""
+
+def get_git_sha():
+    """Return the current git commit SHA, or None if unavailable"""
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def is_deploy_stamp_fresh():
+    """Check if the deploy stamp is newer than every blueprint source file"""
+    try:
+        stamp_mtime = os.stat(DEPLOY_STAMP).st_mtime
+        with open(DEPLOY_STAMP) as f:
+            stamp_sha = f.read().strip()
+    except OSError:
+        return False
+    
+    if stamp_sha != (get_git_sha() or ''):
+        return False
+    
+    with os.scandir(BLUEPRINTS_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith('.py') and entry.stat().st_mtime > stamp_mtime:
+                return False
+    
+    return True
+
+def write_deploy_stamp():
+    """Record a successful deploy so later runs can skip blueprint import"""
+    try:
+        with open(DEPLOY_STAMP, 'w') as f:
+            f.write(get_git_sha() or '')
+    except OSError as e:
+        print(f"⚠️ Could not write deploy stamp: {e}")
+
 def check_requirements():
     """Check if all requirements are met"""
     print("🔍 Checking system requirements...")
     
-    # Check Python version
-    if sys.version_info < (3, 8):
-        print("❌ Python 3.8+ is required")
-        return False
-    
+    # Python version is enforced at import time
     print(f"✅ Python {sys.version_info.major}.{sys.version_info.minor} detected")
     
     # Check if database exists
@@ -34,13 +112,18 @@ def check_requirements():
         'static/uploads/profile_pics'
     ]
     
+    missing_dirs = []
     for directory in upload_dirs:
         if not os.path.exists(directory):
             print(f"📁 Creating directory: {directory}")
-            os.makedirs(directory, exist_ok=True)
+            missing_dirs.append(directory)
         else:
             print(f"✅ Directory exists: {directory}")
     
+    if missing_dirs:
+        with ThreadPoolExecutor(max_workers=len(missing_dirs)) as executor:
+            list(executor.map(lambda d: os.makedirs(d, exist_ok=True), missing_dirs))
+    
     return True
 
 def run_migration():
@@ -61,6 +144,10 @@ def verify_blueprints():
     """Verify that all blueprints are properly registered"""
     print("\n🔍 Verifying blueprint registration...")
     
+    if is_deploy_stamp_fresh():
+        print("✅ Blueprints unchanged since last deploy, skipping import")
+        return True
+    
     try:
         from blueprints import blueprints
         expected_blueprints = ['auth', 'events', 'event_manager', 'main', 'abstracts', 'teams']
@@ -150,6 +237,19 @@ def verify_templates():
     
     return all_exist
 
+def get_table_names(conn, candidates):
+    """Return the set of existing table names in one query"""
+    # PRAGMA table_list requires SQLite 3.37+; older versions silently return no rows
+    if sqlite3.sqlite_version_info >= (3, 37, 0):
+        rows = conn.execute("PRAGMA table_list").fetchall()
+        return {row[1] for row in rows if row[2] == 'table'}
+    placeholders = ', '.join('?' * len(candidates))
+    rows = conn.execute(
+        f"SELECT name FROM sqlite_master WHERE type='table' AND name IN ({placeholders})",
+        list(candidates)
+    ).fetchall()
+    return {row[0] for row in rows}
+
 def run_basic_tests():
     """Run basic functionality tests"""
     print("\n🧪 Running basic functionality tests...")
@@ -166,9 +266,16 @@ def run_basic_tests():
             'team_activity_logs'
         ]
         
+        # Test database integrity
+        integrity = conn.execute("PRAGMA quick_check").fetchone()[0]
+        if integrity != 'ok':
+            print(f"❌ Database integrity check failed: {integrity}")
+            return False
+        
+        existing_tables = get_table_names(conn, tables_to_check)
+        
         for table in tables_to_check:
-            result = conn.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table}'").fetchone()
-            if result:
+            if table in existing_tables:
                 print(f"✅ Table '{table}' exists")
             else:
                 print(f"❌ Table '{table}' missing")
@@ -182,31 +289,7 @@ def run_basic_tests():
 
 def display_usage_instructions():
     """Display usage instructions"""
-    print("\n" + "="*60)
-    print("🎉 DEPLOYMENT COMPLETED SUCCESSFULLY!")
-    print("="*60)
-    print("\n📋 NEXT STEPS:")
-    print("\n1. Start the application:")
-    print("   python app.py")
-    print("\n2. Access the application:")
-    print("   http://localhost:5000")
-    print("\n3. Test new features:")
-    print("   • Create or join teams for events")
-    print("   • Submit abstracts for hackathons/competitions")
-    print("   • Review submissions as event manager")
-    print("   • Export reports and analytics")
-    print("\n4. Default accounts:")
-    print("   • Admin: admin/admin123")
-    print("   • Event Manager: manager1/manager123")
-    print("   • Students: john_doe/student123, jane_smith/student123")
-    print("\n📚 Documentation:")
-    print("   • See ABSTRACT_TEAM_FEATURES.md for detailed documentation")
-    print("   • Check application logs for any issues")
-    print("\n🔧 Configuration:")
-    print("   • Modify event requirements in the admin panel")
-    print("   • Adjust plagiarism thresholds as needed")
-    print("   • Configure email settings for notifications")
-    print("\n" + "="*60)
+    sys.stdout.write(USAGE_INSTRUCTIONS)
 
 def main():
     """Main deployment function"""
@@ -247,7 +330,10 @@ def main():
     # Step 7: Create sample data
     create_sample_data()
     
-    # Step 8: Display instructions
+    # Step 8: Record successful deploy
+    write_deploy_stamp()
+    
+    # Step 9: Display instructions
     display_usage_instructions()
 
 if __name__ == "__main__":
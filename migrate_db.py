@@ -1,6 +1,81 @@
 import sqlite3
 from datetime import datetime
 
+# Columns added by this migration: (table, column, declaration, backfill expression)
+COLUMN_ADDITIONS = [
+    ('users', 'created_at', 'TIMESTAMP', 'CURRENT_TIMESTAMP'),
+    ('users', 'last_login', 'TIMESTAMP', None),
+    ('users', 'profile_picture', 'TEXT', None),
+    ('users', 'full_name', 'TEXT', None),
+
+    ('assignments', 'created_at', 'TIMESTAMP', 'CURRENT_TIMESTAMP'),
+    ('assignments', 'due_date', 'TIMESTAMP', None),
+    ('assignments', 'max_marks', 'INTEGER DEFAULT 100', None),
+    ('assignments', 'instructions', 'TEXT', None),
+    ('assignments', 'is_active', 'BOOLEAN DEFAULT 1', None),
+    ('assignments', 'category', 'TEXT DEFAULT "General"', None),
+
+    ('submissions', 'submitted_at', 'TIMESTAMP', 'CURRENT_TIMESTAMP'),
+    ('submissions', 'file_name', 'TEXT', None),
+    ('submissions', 'file_size', 'INTEGER', None),
+    ('submissions', 'file_type', 'TEXT', None),
+    ('submissions', 'plagiarism_score', 'REAL DEFAULT 0.0', None),
+    ('submissions', 'grade', 'INTEGER', None),
+    ('submissions', 'feedback', 'TEXT', None),
+    ('submissions', 'status', 'TEXT DEFAULT "submitted"', None),
+
+    ('source_docs', 'title', 'TEXT', None),
+    ('source_docs', 'author', 'TEXT', None),
+    ('source_docs', 'created_at', 'TIMESTAMP', 'CURRENT_TIMESTAMP'),
+
+    ('abstract_submissions', 'minhash', 'BLOB', None),
+]
+
+# Indexes created by this migration: (statement, log message)
+INDEXES = [
+    ('CREATE INDEX IF NOT EXISTS idx_assignments_faculty ON assignments(faculty_id)',
+     "Created index on assignments.faculty_id"),
+    ('CREATE INDEX IF NOT EXISTS idx_assignments_due_date ON assignments(due_date)',
+     "Created index on assignments.due_date"),
+    # (column, status) composites also serve plain column lookups, so they
+    # replace the earlier single-column indexes
+    ('DROP INDEX IF EXISTS idx_submissions_assignment',
+     "Dropped index idx_submissions_assignment"),
+    ('DROP INDEX IF EXISTS idx_submissions_student',
+     "Dropped index idx_submissions_student"),
+    ('CREATE INDEX IF NOT EXISTS idx_submissions_assignment_status ON submissions(assignment_id, status)',
+     "Created index on submissions(assignment_id, status)"),
+    ('CREATE INDEX IF NOT EXISTS idx_submissions_student_status ON submissions(student_id, status)',
+     "Created index on submissions(student_id, status)"),
+    ('CREATE INDEX IF NOT EXISTS idx_submissions_status ON submissions(status)',
+     "Created index on submissions.status"),
+    ('CREATE INDEX IF NOT EXISTS idx_notifications_user ON notifications(user_id)',
+     "Created index on notifications.user_id"),
+    ('CREATE INDEX IF NOT EXISTS idx_notifications_read ON notifications(is_read)',
+     "Created index on notifications.is_read"),
+    ('CREATE UNIQUE INDEX IF NOT EXISTS idx_submissions_unique ON submissions(student_id, assignment_id)',
+     "Created unique index on submissions"),
+    # Plagiarism checks filter on (event_id, is_latest_version[, plagiarism_status])
+    ('CREATE INDEX IF NOT EXISTS idx_abs_plag_status ON abstract_submissions(event_id, is_latest_version, plagiarism_status)',
+     "Created index on abstract_submissions(event_id, is_latest_version, plagiarism_status)"),
+]
+
+def upgrade_team_members_index(cursor):
+    """
+    Make idx_team_members_user cover the validators' "already in a team"
+    lookup; the event_registrations check is already served by
+    UNIQUE(event_id, user_id). Rebuilt only when team_id is missing from it.
+    """
+    cursor.execute("PRAGMA index_info('idx_team_members_user')")
+    indexed = {row[2] for row in cursor.fetchall()}
+    if 'team_id' in indexed:
+        return
+    if indexed:
+        cursor.execute('DROP INDEX idx_team_members_user')
+        print("Dropped index idx_team_members_user")
+    cursor.execute('CREATE INDEX idx_team_members_user ON team_members(user_id, status, team_id)')
+    print("Created index on team_members(user_id, status, team_id)")
+
 def get_column_names(cursor, table_name):
     """Get existing column names for a table"""
     cursor.execute(f"PRAGMA table_info({table_name})")
@@ -11,105 +86,44 @@ def column_exists(cursor, table_name, column_name):
     columns = get_column_names(cursor, table_name)
     return column_name in columns
 
+def add_column_if_missing(cursor, existing_columns, table_name, column_name, declaration, backfill=None):
+    """Add a column unless it already exists, optionally backfilling existing rows.
+
+    SQLite rejects non-constant defaults such as CURRENT_TIMESTAMP in
+    ALTER TABLE ADD COLUMN, so timestamp columns are backfilled with an
+    UPDATE. The new column is entirely NULL, so no WHERE clause is needed.
+    """
+    if column_name in existing_columns[table_name]:
+        return False
+    if not existing_columns[table_name]:
+        # Table doesn't exist in this database; nothing to migrate
+        return False
+    cursor.execute(f'ALTER TABLE {table_name} ADD COLUMN {column_name} {declaration}')
+    if backfill is not None:
+        cursor.execute(f'UPDATE {table_name} SET {column_name} = {backfill}')
+    existing_columns[table_name].add(column_name)
+    print(f"Added {column_name} to {table_name} table")
+    return True
+
 def migrate_database():
     """Migrate existing database to new schema"""
-    conn = sqlite3.connect('database.db')
+    # Autocommit mode; the whole migration runs in one explicit transaction
+    conn = sqlite3.connect('database.db', isolation_level=None)
     cursor = conn.cursor()
     
     print("Starting database migration...")
     
     try:
-        # Check and add new columns to users table
-        if not column_exists(cursor, 'users', 'created_at'):
-            cursor.execute('ALTER TABLE users ADD COLUMN created_at TIMESTAMP')
-            cursor.execute('UPDATE users SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL')
-            print("Added created_at to users table")
-            
-        if not column_exists(cursor, 'users', 'last_login'):
-            cursor.execute('ALTER TABLE users ADD COLUMN last_login TIMESTAMP')
-            print("Added last_login to users table")
-            
-        if not column_exists(cursor, 'users', 'profile_picture'):
-            cursor.execute('ALTER TABLE users ADD COLUMN profile_picture TEXT')
-            print("Added profile_picture to users table")
-            
-        if not column_exists(cursor, 'users', 'full_name'):
-            cursor.execute('ALTER TABLE users ADD COLUMN full_name TEXT')
-            print("Added full_name to users table")
-        
-        # Check and add new columns to assignments table
-        if not column_exists(cursor, 'assignments', 'created_at'):
-            cursor.execute('ALTER TABLE assignments ADD COLUMN created_at TIMESTAMP')
-            cursor.execute('UPDATE assignments SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL')
-            print("Added created_at to assignments table")
-            
-        if not column_exists(cursor, 'assignments', 'due_date'):
-            cursor.execute('ALTER TABLE assignments ADD COLUMN due_date TIMESTAMP')
-            print("Added due_date to assignments table")
-            
-        if not column_exists(cursor, 'assignments', 'max_marks'):
-            cursor.execute('ALTER TABLE assignments ADD COLUMN max_marks INTEGER DEFAULT 100')
-            print("Added max_marks to assignments table")
-            
-        if not column_exists(cursor, 'assignments', 'instructions'):
-            cursor.execute('ALTER TABLE assignments ADD COLUMN instructions TEXT')
-            print("Added instructions to assignments table")
-            
-        if not column_exists(cursor, 'assignments', 'is_active'):
-            cursor.execute('ALTER TABLE assignments ADD COLUMN is_active BOOLEAN DEFAULT 1')
-            print("Added is_active to assignments table")
-            
-        if not column_exists(cursor, 'assignments', 'category'):
-            cursor.execute('ALTER TABLE assignments ADD COLUMN category TEXT DEFAULT "General"')
-            print("Added category to assignments table")
+        cursor.execute("BEGIN")
         
-        # Check and add new columns to submissions table
-        if not column_exists(cursor, 'submissions', 'submitted_at'):
-            cursor.execute('ALTER TABLE submissions ADD COLUMN submitted_at TIMESTAMP')
-            cursor.execute('UPDATE submissions SET submitted_at = CURRENT_TIMESTAMP WHERE submitted_at IS NULL')
-            print("Added submitted_at to submissions table")
-            
-        if not column_exists(cursor, 'submissions', 'file_name'):
-            cursor.execute('ALTER TABLE submissions ADD COLUMN file_name TEXT')
-            print("Added file_name to submissions table")
-            
-        if not column_exists(cursor, 'submissions', 'file_size'):
-            cursor.execute('ALTER TABLE submissions ADD COLUMN file_size INTEGER')
-            print("Added file_size to submissions table")
-            
-        if not column_exists(cursor, 'submissions', 'file_type'):
-            cursor.execute('ALTER TABLE submissions ADD COLUMN file_type TEXT')
-            print("Added file_type to submissions table")
-            
-        if not column_exists(cursor, 'submissions', 'plagiarism_score'):
-            cursor.execute('ALTER TABLE submissions ADD COLUMN plagiarism_score REAL DEFAULT 0.0')
-            print("Added plagiarism_score to submissions table")
-            
-        if not column_exists(cursor, 'submissions', 'grade'):
-            cursor.execute('ALTER TABLE submissions ADD COLUMN grade INTEGER')
-            print("Added grade to submissions table")
-            
-        if not column_exists(cursor, 'submissions', 'feedback'):
-            cursor.execute('ALTER TABLE submissions ADD COLUMN feedback TEXT')
-            print("Added feedback to submissions table")
-            
-        if not column_exists(cursor, 'submissions', 'status'):
-            cursor.execute('ALTER TABLE submissions ADD COLUMN status TEXT DEFAULT "submitted"')
-            print("Added status to submissions table")
+        # Read each table's columns once up front
+        existing_columns = {
+            table: set(get_column_names(cursor, table))
+            for table in {table for table, _, _, _ in COLUMN_ADDITIONS}
+        }
         
-        # Update source_docs table
-        if not column_exists(cursor, 'source_docs', 'title'):
-            cursor.execute('ALTER TABLE source_docs ADD COLUMN title TEXT')
-            print("Added title to source_docs table")
-            
-        if not column_exists(cursor, 'source_docs', 'author'):
-            cursor.execute('ALTER TABLE source_docs ADD COLUMN author TEXT')
-            print("Added author to source_docs table")
-            
-        if not column_exists(cursor, 'source_docs', 'created_at'):
-            cursor.execute('ALTER TABLE source_docs ADD COLUMN created_at TIMESTAMP')
-            cursor.execute('UPDATE source_docs SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL')
-            print("Added created_at to source_docs table")
+        for table_name, column_name, declaration, backfill in COLUMN_ADDITIONS:
+            add_column_if_missing(cursor, existing_columns, table_name, column_name, declaration, backfill)
         
         # Create notifications table if it doesn't exist
         cursor.execute('''
@@ -126,53 +140,16 @@ def migrate_database():
         ''')
         print("Created notifications table")
         
-        # Create indexes (only if columns exist)
-        try:
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_assignments_faculty ON assignments(faculty_id)')
-            print("Created index on assignments.faculty_id")
-        except sqlite3.OperationalError:
-            pass
-            
-        try:
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_assignments_due_date ON assignments(due_date)')
-            print("Created index on assignments.due_date")
-        except sqlite3.OperationalError:
-            pass
-            
-        try:
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_submissions_assignment ON submissions(assignment_id)')
-            print("Created index on submissions.assignment_id")
-        except sqlite3.OperationalError:
-            pass
-            
-        try:
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_submissions_student ON submissions(student_id)')
-            print("Created index on submissions.student_id")
-        except sqlite3.OperationalError:
-            pass
-            
-        try:
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_submissions_status ON submissions(status)')
-            print("Created index on submissions.status")
-        except sqlite3.OperationalError:
-            pass
-            
-        try:
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_notifications_user ON notifications(user_id)')
-            print("Created index on notifications.user_id")
-        except sqlite3.OperationalError:
-            pass
-            
-        try:
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_notifications_read ON notifications(is_read)')
-            print("Created index on notifications.is_read")
-        except sqlite3.OperationalError:
-            pass
-        
-        # Add unique constraint to submissions if it doesn't exist
+        # Create indexes after the column changes, in the same transaction
+        # (skipped if the indexed columns don't exist)
+        for statement, message in INDEXES:
+            try:
+                cursor.execute(statement)
+                print(message)
+            except sqlite3.OperationalError:
+                pass
         try:
-            cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_submissions_unique ON submissions(student_id, assignment_id)')
-            print("Created unique index on submissions")
+            upgrade_team_members_index(cursor)
         except sqlite3.OperationalError:
             pass
         
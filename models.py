@@ -1,31 +1,115 @@
+from flask import g, has_app_context
 from flask_login import UserMixin
+from dataclasses import dataclass, field
+from typing import Optional
 import sqlite3
+import threading
+import time
+
+DATABASE = 'database.db'
+
+# journal_mode is persistent, so it only needs to be switched once per process
+_wal_configured = False
+
+# Fallback per-thread connection for callers outside a Flask app context (CLI scripts)
+_local = threading.local()
+
+class PooledConnection(sqlite3.Connection):
+    """Shared connection whose close() only releases it back for reuse"""
+
+    def close(self):
+        """Discard any uncommitted work, as a real close would, but keep the connection open"""
+        if self.in_transaction:
+            self.rollback()
+
+    def close_for_real(self):
+        sqlite3.Connection.close(self)
+
+def _open_connection():
+    global _wal_configured
+    # Statements are prepared once per connection, which is shared for a whole app context
+    conn = sqlite3.connect(DATABASE, factory=PooledConnection, check_same_thread=False,
+                           cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    if not _wal_configured:
+        conn.execute("PRAGMA journal_mode = WAL")
+        _wal_configured = True
+    # Enable foreign key constraints
+    conn.execute("PRAGMA foreign_keys = ON")
+    # NORMAL is durable under WAL and avoids an fsync per commit
+    conn.execute("PRAGMA synchronous = NORMAL")
+    # Wait in SQLite for up to 5 s when another writer holds the lock
+    conn.execute("PRAGMA busy_timeout = 5000")
+    # Memory-mapped reads (up to 256 MiB, per connection). Mapped pages
+    # show up in each worker's RSS but are shared via the OS page cache.
+    conn.execute("PRAGMA mmap_size = 268435456")
+    # 64 MiB page cache and in-memory temp tables for sorts/joins
+    conn.execute("PRAGMA cache_size = -64000")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
 
 def get_db_connection():
-    """Get database connection with proper error handling"""
+    """Get the shared database connection for the current app context or thread"""
     try:
-        conn = sqlite3.connect('database.db')
-        conn.row_factory = sqlite3.Row
-        # Enable foreign key constraints
-        conn.execute("PRAGMA foreign_keys = ON")
+        if has_app_context():
+            if 'db' not in g:
+                g.db = _open_connection()
+            return g.db
+        conn = getattr(_local, 'conn', None)
+        if conn is None:
+            conn = _local.conn = _open_connection()
         return conn
     except sqlite3.Error as e:
         print(f"Database connection error: {e}")
         raise
 
+def close_db_connection(exception=None):
+    """Close the app-context connection; registered as a teardown handler"""
+    conn = g.pop('db', None)
+    if conn is not None:
+        # Refresh planner statistics for tables this connection queried; cheap
+        # when nothing changed, and only effective on the connection that ran them
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+        conn.close_for_real()
+
+# Column lists in model field order, so a fetched row unpacks straight into the
+# constructor. The optional users columns are guaranteed by migrate_db.py.
+USER_COLUMNS = ('id, username, email, password, role, is_verified, otp, '
+                'last_login, profile_picture, full_name')
+EVENT_COLUMNS = ('id, title, description, event_type, event_code, manager_id, '
+                 'start_date, end_date, registration_deadline, venue, max_participants, '
+                 'max_team_size, min_team_size, is_team_event, status, banner_image, '
+                 'resources_link, prize_pool, created_at, updated_at')
+
+# Hot lookups as fixed SQL strings, so repeat calls hit the connection's statement cache
+SQL_USER_BY_ID = f"SELECT {USER_COLUMNS} FROM users WHERE id = ?"
+SQL_USER_BY_USERNAME = f"SELECT {USER_COLUMNS} FROM users WHERE username = ?"
+SQL_EVENT_BY_CODE = f"SELECT {EVENT_COLUMNS} FROM events WHERE event_code = ?"
+
+# Flask-Login calls User.get on every authenticated request; keep loaded users
+# for a short while so the hot path skips the SELECT. Entries are dropped on
+# writes through User.invalidate, and the TTL bounds staleness otherwise.
+USER_CACHE_SIZE = 2048
+USER_CACHE_TTL = 30
+_user_cache = {}
+_user_cache_lock = threading.Lock()
+
+# eq=False keeps UserMixin's id-based __eq__
+@dataclass(slots=True, eq=False)
 class User(UserMixin):
-    ...
-    def __init__(self, id, username, email, password, role, is_verified, otp, last_login=None, profile_picture=None, full_name=None):
-        self.id = id
-        self.username = username
-        self.email = email
-        self.password = password
-        self.role = role
-        self.is_verified = is_verified
-        self.otp = otp
-        self.last_login = last_login
-        self.profile_picture = profile_picture
-        self.full_name = full_name
+    id: int
+    username: str
+    email: str
+    password: str = field(repr=False)
+    role: str
+    is_verified: bool
+    otp: Optional[str] = field(repr=False)
+    last_login: Optional[str] = None
+    profile_picture: Optional[str] = None
+    full_name: Optional[str] = None
 
     def is_active(self):
         """Return True if the user account is active."""
@@ -47,191 +131,149 @@ class User(UserMixin):
 
     @staticmethod
     def get(user_id):
+        key = str(user_id)
+        now = time.monotonic()
+        with _user_cache_lock:
+            entry = _user_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
         conn = get_db_connection()
-        user = conn.execute("SELECT * FROM users WHERE id = ?", (user_id,)).fetchone()
-        conn.close()
+        user = conn.execute(SQL_USER_BY_ID, (user_id,)).fetchone()
         if not user:
             return None
-        return User(
-            id=user['id'],
-            username=user['username'],
-            email=user['email'],
-            password=user['password'],
-            role=user['role'],
-            is_verified=user['is_verified'],
-            otp=user['otp'],
-            last_login=user['last_login'] if 'last_login' in user.keys() else None,
-            profile_picture=user['profile_picture'] if 'profile_picture' in user.keys() else None,
-            full_name=user['full_name'] if 'full_name' in user.keys() else None
-        )
+        user = User(*user)
+        with _user_cache_lock:
+            _user_cache.pop(key, None)
+            if len(_user_cache) >= USER_CACHE_SIZE:
+                # dicts keep insertion order, so the first key is the oldest entry
+                del _user_cache[next(iter(_user_cache))]
+            _user_cache[key] = (now + USER_CACHE_TTL, user)
+        return user
+
+    @staticmethod
+    def invalidate(user_id):
+        """Drop a cached user after its row has been updated"""
+        with _user_cache_lock:
+            _user_cache.pop(str(user_id), None)
 
     @staticmethod
     def get_by_username(username):
         conn = get_db_connection()
-        user = conn.execute("SELECT * FROM users WHERE username = ?", (username,)).fetchone()
-        conn.close()
+        user = conn.execute(SQL_USER_BY_USERNAME, (username,)).fetchone()
         if not user:
             return None
-        return User(
-            id=user['id'],
-            username=user['username'],
-            email=user['email'],
-            password=user['password'],
-            role=user['role'],
-            is_verified=user['is_verified'],
-            otp=user['otp'],
-            last_login=user['last_login'] if 'last_login' in user.keys() else None,
-            profile_picture=user['profile_picture'] if 'profile_picture' in user.keys() else None,
-            full_name=user['full_name'] if 'full_name' in user.keys() else None
-        )
+        return User(*user)
 
+@dataclass(slots=True)
 class Event:
-    def __init__(self, id, title, description, event_type, event_code, manager_id, start_date, end_date, 
-                 registration_deadline, venue=None, max_participants=None, max_team_size=5, min_team_size=1,
-                 is_team_event=True, status='upcoming', banner_image=None, resources_link=None, prize_pool=None,
-                 created_at=None, updated_at=None):
-        self.id = id
-        self.title = title
-        self.description = description
-        self.event_type = event_type
-        self.event_code = event_code
-        self.manager_id = manager_id
-        self.start_date = start_date
-        self.end_date = end_date
-        self.registration_deadline = registration_deadline
-        self.venue = venue
-        self.max_participants = max_participants
-        self.max_team_size = max_team_size
-        self.min_team_size = min_team_size
-        self.is_team_event = is_team_event
-        self.status = status
-        self.banner_image = banner_image
-        self.resources_link = resources_link
-        self.prize_pool = prize_pool
-        self.created_at = created_at
-        self.updated_at = updated_at
+    id: int
+    title: str
+    description: str
+    event_type: str
+    event_code: str
+    manager_id: int
+    start_date: str
+    end_date: str
+    registration_deadline: str
+    venue: Optional[str] = None
+    max_participants: Optional[int] = None
+    max_team_size: int = 5
+    min_team_size: int = 1
+    is_team_event: bool = True
+    status: str = 'upcoming'
+    banner_image: Optional[str] = None
+    resources_link: Optional[str] = None
+    prize_pool: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
 
     @staticmethod
     def get_by_code(event_code):
         conn = get_db_connection()
-        event = conn.execute("SELECT * FROM events WHERE event_code = ?", (event_code,)).fetchone()
-        conn.close()
+        event = conn.execute(SQL_EVENT_BY_CODE, (event_code,)).fetchone()
         if not event:
             return None
-        return Event(
-            id=event['id'],
-            title=event['title'],
-            description=event['description'],
-            event_type=event['event_type'],
-            event_code=event['event_code'],
-            manager_id=event['manager_id'],
-            start_date=event['start_date'],
-            end_date=event['end_date'],
-            registration_deadline=event['registration_deadline'],
-            venue=event['venue'] if 'venue' in event.keys() else None,
-            max_participants=event['max_participants'] if 'max_participants' in event.keys() else None,
-            max_team_size=event['max_team_size'] if 'max_team_size' in event.keys() else 5,
-            min_team_size=event['min_team_size'] if 'min_team_size' in event.keys() else 1,
-            is_team_event=event['is_team_event'] if 'is_team_event' in event.keys() else True,
-            status=event['status'] if 'status' in event.keys() else 'upcoming',
-            banner_image=event['banner_image'] if 'banner_image' in event.keys() else None,
-            resources_link=event['resources_link'] if 'resources_link' in event.keys() else None,
-            prize_pool=event['prize_pool'] if 'prize_pool' in event.keys() else None,
-            created_at=event['created_at'] if 'created_at' in event.keys() else None,
-            updated_at=event['updated_at'] if 'updated_at' in event.keys() else None
-        )
+        return Event(*event)
 
+@dataclass(slots=True)
 class EventRegistration:
-    def __init__(self, id, event_id, user_id, team_id=None, registration_status='pending', 
-                 registered_at=None, approved_at=None, notes=None):
-        self.id = id
-        self.event_id = event_id
-        self.user_id = user_id
-        self.team_id = team_id
-        self.registration_status = registration_status
-        self.registered_at = registered_at
-        self.approved_at = approved_at
-        self.notes = notes
+    id: int
+    event_id: int
+    user_id: int
+    team_id: Optional[int] = None
+    registration_status: str = 'pending'
+    registered_at: Optional[str] = None
+    approved_at: Optional[str] = None
+    notes: Optional[str] = None
 
+@dataclass(slots=True)
 class Team:
-    def __init__(self, id, name, description, event_id, leader_id, status='forming', 
-                 max_members=5, is_open=True, team_code=None, created_at=None, updated_at=None,
-                 has_submitted_abstract=False, abstract_status='not_required', invitation_code=None, is_public=False):
-        self.id = id
-        self.name = name
-        self.description = description
-        self.event_id = event_id
-        self.leader_id = leader_id
-        self.status = status
-        self.max_members = max_members
-        self.is_open = is_open
-        self.team_code = team_code
-        self.created_at = created_at
-        self.updated_at = updated_at
-        self.has_submitted_abstract = has_submitted_abstract
-        self.abstract_status = abstract_status
-        self.invitation_code = invitation_code
-        self.is_public = is_public
+    id: int
+    name: str
+    description: str
+    event_id: int
+    leader_id: int
+    status: str = 'forming'
+    max_members: int = 5
+    is_open: bool = True
+    team_code: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    has_submitted_abstract: bool = False
+    abstract_status: str = 'not_required'
+    invitation_code: Optional[str] = None
+    is_public: bool = False
 
+@dataclass(slots=True)
 class AbstractSubmission:
-    def __init__(self, id, event_id, team_id, user_id, title, abstract_text, file_path=None, 
-                 file_name=None, file_size=None, word_count=0, status='draft', plagiarism_score=0.0,
-                 plagiarism_status='pending', submitted_at=None, reviewed_by=None, reviewed_at=None,
-                 feedback=None, revision_notes=None, version=1, is_latest_version=True,
-                 created_at=None, updated_at=None):
-        self.id = id
-        self.event_id = event_id
-        self.team_id = team_id
-        self.user_id = user_id
-        self.title = title
-        self.abstract_text = abstract_text
-        self.file_path = file_path
-        self.file_name = file_name
-        self.file_size = file_size
-        self.word_count = word_count
-        self.status = status
-        self.plagiarism_score = plagiarism_score
-        self.plagiarism_status = plagiarism_status
-        self.submitted_at = submitted_at
-        self.reviewed_by = reviewed_by
-        self.reviewed_at = reviewed_at
-        self.feedback = feedback
-        self.revision_notes = revision_notes
-        self.version = version
-        self.is_latest_version = is_latest_version
-        self.created_at = created_at
-        self.updated_at = updated_at
+    id: int
+    event_id: int
+    team_id: int
+    user_id: int
+    title: str
+    abstract_text: str
+    file_path: Optional[str] = None
+    file_name: Optional[str] = None
+    file_size: Optional[int] = None
+    word_count: int = 0
+    status: str = 'draft'
+    plagiarism_score: float = 0.0
+    plagiarism_status: str = 'pending'
+    submitted_at: Optional[str] = None
+    reviewed_by: Optional[int] = None
+    reviewed_at: Optional[str] = None
+    feedback: Optional[str] = None
+    revision_notes: Optional[str] = None
+    version: int = 1
+    is_latest_version: bool = True
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
 
+@dataclass(slots=True)
 class TeamInvitation:
-    def __init__(self, id, team_id, inviter_id, invitee_email, invitee_id=None, 
-                 invitation_token=None, message=None, status='pending', created_at=None,
-                 expires_at=None, responded_at=None):
-        self.id = id
-        self.team_id = team_id
-        self.inviter_id = inviter_id
-        self.invitee_email = invitee_email
-        self.invitee_id = invitee_id
-        self.invitation_token = invitation_token
-        self.message = message
-        self.status = status
-        self.created_at = created_at
-        self.expires_at = expires_at
-        self.responded_at = responded_at
+    id: int
+    team_id: int
+    inviter_id: int
+    invitee_email: str
+    invitee_id: Optional[int] = None
+    invitation_token: Optional[str] = None
+    message: Optional[str] = None
+    status: str = 'pending'
+    created_at: Optional[str] = None
+    expires_at: Optional[str] = None
+    responded_at: Optional[str] = None
 
+@dataclass(slots=True)
 class EventRequirement:
-    def __init__(self, id, event_id, requires_abstract=False, abstract_min_words=150,
-                 abstract_max_words=500, abstract_deadline=None, allowed_file_types='pdf,docx,txt',
-                 max_file_size_mb=5, plagiarism_threshold=0.25, auto_approve_threshold=0.10,
-                 created_at=None, updated_at=None):
-        self.id = id
-        self.event_id = event_id
-        self.requires_abstract = requires_abstract
-        self.abstract_min_words = abstract_min_words
-        self.abstract_max_words = abstract_max_words
-        self.abstract_deadline = abstract_deadline
-        self.allowed_file_types = allowed_file_types
-        self.max_file_size_mb = max_file_size_mb
-        self.plagiarism_threshold = plagiarism_threshold
-        self.auto_approve_threshold = auto_approve_threshold
-        self.created_at = created_at
-        self.updated_at = updated_at      
\ No newline at end of file
+    event_id: int
+    requires_abstract: bool = False
+    abstract_min_words: int = 150
+    abstract_max_words: int = 500
+    abstract_deadline: Optional[str] = None
+    allowed_file_types: str = 'pdf,docx,txt'
+    max_file_size_mb: int = 5
+    plagiarism_threshold: float = 0.25
+    auto_approve_threshold: float = 0.10
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
@@ -5,27 +5,72 @@ CampusConnect+ Event Management System
 
 import re
 import hashlib
-from difflib import SequenceMatcher
+import functools
 from collections import Counter
 import sqlite3
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
 from models import get_db_connection
+from plagiarism_kernels import rolling_hashes, count_matching_slots
+
+# MinHash signatures over 5-word shingles, stored in abstract_submissions.minhash.
+# Each permutation is x -> a*x + b (mod 2**64) with odd a; the fixed seed keeps
+# stored signatures comparable across processes.
+MINHASH_PERMUTATIONS = 128
+_minhash_rng = np.random.default_rng(20240301)
+_MINHASH_A = _minhash_rng.integers(0, 2**63, MINHASH_PERMUTATIONS, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_MINHASH_B = _minhash_rng.integers(0, 2**63, MINHASH_PERMUTATIONS, dtype=np.uint64)
+_EMPTY_FINGERPRINT = np.full(MINHASH_PERMUTATIONS, np.iinfo(np.uint64).max, dtype=np.uint64)
+
+# Best TF-IDF matches that always get the exact phrase-overlap check, whether
+# or not their MinHash signatures agree
+PHRASE_CHECK_TOP_K = 10
+
+_WS_RE = re.compile(r'\s+')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+_COMMON_PHRASES = frozenset([
+    "in this paper we",
+    "the purpose of this study",
+    "our research shows",
+    "the results indicate",
+    "in conclusion",
+    "this study aims to",
+    "the main objective",
+    "our findings suggest",
+    "previous research has shown",
+    "it is important to note"
+])
+# One pass over the text finds every common phrase; the lookahead lets matches overlap
+_COMMON_RE = re.compile('(?=(' + '|'.join(map(re.escape, _COMMON_PHRASES)) + '))')
+
+# Each abstract is normalized by several checks and, in a batch run, once per
+# other pending submission; memoize on the text itself
+@functools.lru_cache(maxsize=1024)
+def _normalize(text):
+    # Lowercase, collapse whitespace, then drop punctuation but keep word boundaries
+    return _PUNCT_RE.sub(' ', _WS_RE.sub(' ', text.lower())).strip()
+
+def _encode_chars(text):
+    """UTF-8 bytes of the text as a uint64 array for the hashing kernels"""
+    return np.frombuffer(text.encode('utf-8'), dtype=np.uint8).astype(np.uint64)
+
+def _encode_words(text):
+    """Per-word hashes of the text as a uint64 array for the hashing kernels"""
+    words = text.split()
+    return np.fromiter((hash(word) for word in words), dtype=np.int64, count=len(words)).view(np.uint64)
 
 class PlagiarismChecker:
-    def __init__(self):
+    def __init__(self, vectorizer=None):
         self.min_similarity_threshold = 0.7  # 70% similarity
         self.min_phrase_length = 5  # Minimum words in a phrase to check
+        # Optional pre-fit TfidfVectorizer; otherwise one is fit per check
+        self.vectorizer = vectorizer
         
     def normalize_text(self, text):
         """Normalize text for comparison"""
-        # Convert to lowercase
-        text = text.lower()
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove punctuation but keep word boundaries
-        text = re.sub(r'[^\w\s]', ' ', text)
-        # Remove extra spaces
-        text = text.strip()
-        return text
+        return _normalize(text)
     
     def extract_phrases(self, text, phrase_length=5):
         """Extract overlapping phrases of specified length"""
@@ -38,23 +83,68 @@ class PlagiarismChecker:
         
         return phrases
     
-    def calculate_similarity(self, text1, text2):
-        """Calculate similarity between two texts using SequenceMatcher"""
+    def calculate_similarity(self, text1, text2, shingle_length=5):
+        """Calculate Jaccard similarity of the two texts' character shingles"""
         normalized_text1 = self.normalize_text(text1)
         normalized_text2 = self.normalize_text(text2)
         
-        return SequenceMatcher(None, normalized_text1, normalized_text2).ratio()
+        shingles1 = np.unique(rolling_hashes(_encode_chars(normalized_text1), shingle_length))
+        shingles2 = np.unique(rolling_hashes(_encode_chars(normalized_text2), shingle_length))
+        
+        if not shingles1.size or not shingles2.size:
+            # Too short to shingle; only identical texts count as similar
+            return 1.0 if normalized_text1 == normalized_text2 else 0.0
+        
+        common = np.intersect1d(shingles1, shingles2, assume_unique=True).size
+        return common / (shingles1.size + shingles2.size - common)
+    
+    def calculate_batch_similarity(self, text, others):
+        """Calculate TF-IDF cosine similarity between text and each of the other texts"""
+        documents = [self.normalize_text(text)] + [self.normalize_text(other or '') for other in others]
+        try:
+            if self.vectorizer is not None:
+                matrix = self.vectorizer.transform(documents)
+            else:
+                matrix = TfidfVectorizer().fit_transform(documents)
+        except ValueError:
+            # No usable terms in any document (e.g. empty or single-letter text)
+            return np.zeros(len(others))
+        
+        return cosine_similarity(matrix[0:1], matrix[1:])[0]
+    
+    def _fingerprint(self, text):
+        """MinHash signature of the text's word shingles as a uint64 vector"""
+        phrases = set(self.extract_phrases(self.normalize_text(text or ''), self.min_phrase_length))
+        if not phrases:
+            return _EMPTY_FINGERPRINT
+        
+        # Stable 64-bit shingle hashes (the built-in hash() is salted per process)
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(phrase.encode('utf-8'), digest_size=8).digest(), 'little')
+             for phrase in phrases),
+            dtype=np.uint64, count=len(phrases)
+        )
+        # Arithmetic wraps modulo 2**64
+        return (np.outer(hashes, _MINHASH_A) + _MINHASH_B).min(axis=0)
+    
+    def _stored_fingerprint(self, submission):
+        """Read a submission's stored signature, computing it for rows saved without one"""
+        blob = submission['minhash']
+        if blob and len(blob) == MINHASH_PERMUTATIONS * 8:
+            return np.frombuffer(blob, dtype=np.uint64)
+        return self._fingerprint(submission['abstract_text'])
     
     def check_phrase_overlap(self, text1, text2, phrase_length=5):
         """Check for overlapping phrases between two texts"""
-        phrases1 = set(self.extract_phrases(self.normalize_text(text1), phrase_length))
-        phrases2 = set(self.extract_phrases(self.normalize_text(text2), phrase_length))
+        # Roll a hash over per-word hashes instead of joining each phrase into a string
+        phrases1 = np.unique(rolling_hashes(_encode_words(self.normalize_text(text1)), phrase_length))
+        phrases2 = np.unique(rolling_hashes(_encode_words(self.normalize_text(text2)), phrase_length))
         
-        if not phrases1 or not phrases2:
+        if not phrases1.size or not phrases2.size:
             return 0.0
         
-        common_phrases = phrases1.intersection(phrases2)
-        overlap_ratio = len(common_phrases) / min(len(phrases1), len(phrases2))
+        common_phrases = np.intersect1d(phrases1, phrases2, assume_unique=True)
+        overlap_ratio = common_phrases.size / min(phrases1.size, phrases2.size)
         
         return overlap_ratio
     
@@ -64,7 +154,7 @@ class PlagiarismChecker:
         
         # Get all other submissions for the same event
         query = """
-            SELECT id, title, abstract_text, user_id 
+            SELECT id, title, abstract_text, user_id, minhash 
             FROM abstract_submissions 
             WHERE event_id = ? AND is_latest_version = 1
         """
@@ -74,32 +164,58 @@ class PlagiarismChecker:
             query += " AND id != ?"
             params.append(exclude_submission_id)
         
+        # Borrowed shared connection: not closed, since close() rolls back
+        # any uncommitted work the caller has on it
         submissions = conn.execute(query, params).fetchall()
-        conn.close()
+        
+        return self.check_against_cached(text, submissions)
+    
+    def check_against_cached(self, text, submissions, exclude_submission_id=None):
+        """Check text against already-fetched submission rows (id, title, abstract_text, minhash)
+
+        Exact phrase overlap is computed for the PHRASE_CHECK_TOP_K best TF-IDF
+        matches and for submissions sharing a MinHash slot with the text. The
+        slot test estimates Jaccard similarity while phrase overlap measures
+        containment, so a short text copied into a long one (low Jaccard J) is
+        caught by the slot test only with probability 1 - (1 - J)**128; such
+        pairs rely on ranking in the TF-IDF top k instead.
+        """
+        if exclude_submission_id:
+            submissions = [submission for submission in submissions if submission['id'] != exclude_submission_id]
         
         max_similarity = 0.0
         max_phrase_overlap = 0.0
         similar_submission = None
         
-        for submission in submissions:
-            # Check title similarity
-            title_similarity = self.calculate_similarity(text, submission['title'])
-            
-            # Check abstract similarity
-            abstract_similarity = self.calculate_similarity(text, submission['abstract_text'])
-            
-            # Check phrase overlap
-            phrase_overlap = self.check_phrase_overlap(text, submission['abstract_text'])
-            
-            # Use the maximum similarity found
-            current_similarity = max(title_similarity, abstract_similarity)
-            
-            if current_similarity > max_similarity:
-                max_similarity = current_similarity
-                similar_submission = submission
+        if submissions:
+            # Score the text against every abstract and title in one TF-IDF matrix
+            text_similarities = self.calculate_batch_similarity(
+                text,
+                [submission['abstract_text'] for submission in submissions]
+                + [submission['title'] for submission in submissions]
+            )
+            # Use the better of abstract and title similarity for each submission
+            count = len(submissions)
+            text_similarities = np.maximum(text_similarities[:count], text_similarities[count:])
+            best = int(np.argmax(text_similarities))
+            if text_similarities[best] > 0.0:
+                max_similarity = float(text_similarities[best])
+                similar_submission = submissions[best]
+        
+            # Exact phrase overlap runs for the top TF-IDF matches plus any
+            # submission whose MinHash signature agrees in some slot
+            fingerprints = np.vstack([self._stored_fingerprint(submission) for submission in submissions])
+            candidates = np.union1d(
+                np.argsort(-text_similarities, kind='stable')[:PHRASE_CHECK_TOP_K],
+                np.flatnonzero(count_matching_slots(self._fingerprint(text), fingerprints))
+            )
             
-            if phrase_overlap > max_phrase_overlap:
-                max_phrase_overlap = phrase_overlap
+            for index in candidates:
+                # Check phrase overlap
+                phrase_overlap = self.check_phrase_overlap(text, submissions[index]['abstract_text'])
+                
+                if phrase_overlap > max_phrase_overlap:
+                    max_phrase_overlap = phrase_overlap
         
         # Combine similarity metrics (weighted average)
         combined_score = (max_similarity * 0.7) + (max_phrase_overlap * 0.3)
@@ -114,32 +230,22 @@ class PlagiarismChecker:
     
     def check_common_phrases(self, text):
         """Check for overly common academic phrases"""
-        common_phrases = [
-            "in this paper we",
-            "the purpose of this study",
-            "our research shows",
-            "the results indicate",
-            "in conclusion",
-            "this study aims to",
-            "the main objective",
-            "our findings suggest",
-            "previous research has shown",
-            "it is important to note"
-        ]
-        
         normalized_text = self.normalize_text(text)
-        phrase_count = 0
-        
-        for phrase in common_phrases:
-            if phrase in normalized_text:
-                phrase_count += 1
+        found = set(_COMMON_RE.findall(normalized_text))
         
         # Return ratio of common phrases found
-        return phrase_count / len(common_phrases)
+        return len(found) / len(_COMMON_PHRASES)
     
-    def generate_report(self, text, event_id, exclude_submission_id=None):
-        """Generate a comprehensive plagiarism report"""
-        db_check = self.check_against_database(text, event_id, exclude_submission_id)
+    def generate_report(self, text, event_id, exclude_submission_id=None, submissions=None):
+        """Generate a comprehensive plagiarism report
+
+        Pass the event's latest submissions as ``submissions`` to compare
+        against rows already in memory instead of querying the database.
+        """
+        if submissions is not None:
+            db_check = self.check_against_cached(text, submissions, exclude_submission_id)
+        else:
+            db_check = self.check_against_database(text, event_id, exclude_submission_id)
         common_phrases_ratio = self.check_common_phrases(text)
         
         # Calculate overall risk score
@@ -195,11 +301,17 @@ class PlagiarismChecker:
         
         return recommendations
 
+# Shared checker for the helpers below; it holds no per-check state
+_CHECKER = PlagiarismChecker()
+
 # Utility functions for easy integration
+def compute_abstract_fingerprint(abstract_text):
+    """MinHash signature to store in abstract_submissions.minhash"""
+    return _CHECKER._fingerprint(abstract_text).tobytes()
+
 def check_abstract_plagiarism(abstract_text, event_id, submission_id=None):
     """Quick function to check abstract for plagiarism"""
-    checker = PlagiarismChecker()
-    return checker.generate_report(abstract_text, event_id, submission_id)
+    return _CHECKER.generate_report(abstract_text, event_id, submission_id)
 
 def update_submission_plagiarism_score(submission_id, plagiarism_score, plagiarism_status='clean'):
     """Update plagiarism score in database"""
@@ -215,38 +327,33 @@ def update_submission_plagiarism_score(submission_id, plagiarism_score, plagiari
     except Exception as e:
         print(f"Error updating plagiarism score: {e}")
         return False
-    finally:
-        conn.close()
 
 def batch_check_plagiarism(event_id):
     """Check all submissions for an event for plagiarism"""
     conn = get_db_connection()
     
-    submissions = conn.execute("""
-        SELECT id, abstract_text FROM abstract_submissions 
-        WHERE event_id = ? AND is_latest_version = 1 AND plagiarism_status = 'pending'
+    # Fetch the event's latest submissions once; pending ones are checked
+    # against this in-memory list rather than re-querying per submission
+    all_submissions = conn.execute("""
+        SELECT id, title, abstract_text, user_id, minhash, plagiarism_status FROM abstract_submissions 
+        WHERE event_id = ? AND is_latest_version = 1
     """, (event_id,)).fetchall()
+    submissions = [s for s in all_submissions if s['plagiarism_status'] == 'pending']
     
-    conn.close()
-    
-    checker = PlagiarismChecker()
     results = []
+    updates = []
     
     for submission in submissions:
         try:
-            report = checker.generate_report(
+            report = _CHECKER.generate_report(
                 submission['abstract_text'], 
                 event_id, 
-                submission['id']
+                submission['id'],
+                submissions=all_submissions
             )
             
-            # Update database with results
             status = 'flagged' if report['is_suspicious'] else 'clean'
-            update_submission_plagiarism_score(
-                submission['id'], 
-                report['overall_score'], 
-                status
-            )
+            updates.append((report['overall_score'], status, submission['id']))
             
             results.append({
                 'submission_id': submission['id'],
@@ -257,6 +364,18 @@ def batch_check_plagiarism(event_id):
             print(f"Error checking submission {submission['id']}: {e}")
             continue
     
+    # Update database with all results at once
+    try:
+        conn.executemany("""
+            UPDATE abstract_submissions 
+            SET plagiarism_score = ?, plagiarism_status = ?
+            WHERE id = ?
+        """, updates)
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        print(f"Error updating plagiarism scores: {e}")
+    
     return results
 
 if __name__ == "__main__":
@@ -1,15 +1,19 @@
 import string
+import functools
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import re
 
+_DIGIT_RE = re.compile(r'\d+')
+_PUNCT_TRANS = str.maketrans('', '', string.punctuation)
+
+# Other submissions are re-cleaned on every check, so cache by text
+@functools.lru_cache(maxsize=1024)
 def clean_text(text):
-    text = text.lower()
-    text = re.sub(r'\d+', '', text)
-    text = text.translate(str.maketrans('', '', string.punctuation))
-    return text
+    return _DIGIT_RE.sub('', text.lower()).translate(_PUNCT_TRANS)
 
-def check_plagiarism(user_text, source_documents):
+def check_plagiarism(user_text, source_documents, min_threshold=0.0):
     if not user_text:
         return []
 
@@ -25,11 +29,10 @@ def check_plagiarism(user_text, source_documents):
     user_vector = tfidf_matrix[0:1]
     similarity_scores = cosine_similarity(user_vector, tfidf_matrix[1:])
 
-    results = []
-    for i, score in enumerate(similarity_scores[0]):
-        results.append({
-            'source': source_documents[i],
-            'similarity': f"{score * 100:.2f}%"
-        })
-    
-    return results
\ No newline at end of file
+    # Filter in NumPy and only format the sources that are kept
+    scores = similarity_scores[0]
+    keep = np.nonzero(scores >= min_threshold)[0]
+    return [
+        {'source': source_documents[i], 'similarity': f"{scores[i] * 100:.2f}%"}
+        for i in keep
+    ]
@@ -0,0 +1,80 @@
+"""
+Numeric kernels for the plagiarism checker
+CampusConnect+ Event Management System
+
+Only integer array code lives here; text is normalized and encoded by the
+caller. Numba is optional: when it is installed the loops are compiled,
+otherwise equivalent vectorized NumPy versions are used. Both produce
+identical results.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Polynomial hashes are taken modulo 2**64 by letting uint64 arithmetic wrap
+ROLLING_HASH_BASE = 257
+
+
+def _rolling_hashes_numpy(values, k, base):
+    count = values.shape[0] - k + 1
+    hashes = np.zeros(count, dtype=np.uint64)
+    for j in range(k):
+        hashes = hashes * np.uint64(base) + values[j:j + count]
+    return hashes
+
+
+def _count_matching_slots_numpy(query, fingerprints):
+    return (fingerprints == query).sum(axis=1)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _rolling_hashes_jit(values, k, base):
+        count = values.shape[0] - k + 1
+        hashes = np.empty(count, dtype=np.uint64)
+        b = np.uint64(base)
+        high = np.uint64(1)
+        for _ in range(k - 1):
+            high *= b
+        h = np.uint64(0)
+        for i in range(k):
+            h = h * b + values[i]
+        hashes[0] = h
+        for i in range(k, values.shape[0]):
+            # Drop the outgoing value and shift in the next one in O(1)
+            h = (h - values[i - k] * high) * b + values[i]
+            hashes[i - k + 1] = h
+        return hashes
+
+    @njit(cache=True)
+    def _count_matching_slots_jit(query, fingerprints):
+        rows, slots = fingerprints.shape
+        counts = np.zeros(rows, dtype=np.int64)
+        for row in range(rows):
+            for slot in range(slots):
+                if fingerprints[row, slot] == query[slot]:
+                    counts[row] += 1
+        return counts
+
+
+def rolling_hashes(values, k=5, base=ROLLING_HASH_BASE):
+    """Karp-Rabin hashes of every length-k window of a uint64 array"""
+    values = np.ascontiguousarray(values, dtype=np.uint64)
+    if values.shape[0] < k:
+        return np.empty(0, dtype=np.uint64)
+    if njit is not None:
+        return _rolling_hashes_jit(values, k, base)
+    return _rolling_hashes_numpy(values, k, base)
+
+
+def count_matching_slots(query, fingerprints):
+    """Number of equal slots between a signature and each row of an (N, k) signature array"""
+    query = np.ascontiguousarray(query, dtype=np.uint64)
+    fingerprints = np.ascontiguousarray(fingerprints, dtype=np.uint64)
+    if njit is not None:
+        return _count_matching_slots_jit(query, fingerprints)
+    return _count_matching_slots_numpy(query, fingerprints)
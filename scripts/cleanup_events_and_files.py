@@ -12,12 +12,10 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DB_PATH = os.path.join(PROJECT_ROOT, 'database.db')
 
 
-def table_exists(conn, name: str) -> bool:
-    row = conn.execute(
-        "SELECT 1 FROM sqlite_master WHERE type='table' AND name = ?",
-        (name,),
-    ).fetchone()
-    return row is not None
+def get_table_names(conn) -> set[str]:
+    """Return the names of all tables in one query."""
+    rows = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+    return {row[0] for row in rows}
 
 
 def resolve_path(path: str) -> str | None:
@@ -33,8 +31,8 @@ def resolve_path(path: str) -> str | None:
     return os.path.join(PROJECT_ROOT, path)
 
 
-def delete_files_from_table(conn, table: str, column: str) -> None:
-    if not table_exists(conn, table):
+def delete_files_from_table(conn, tables: set[str], table: str, column: str) -> None:
+    if table not in tables:
         print(f"[SKIP] Table '{table}' not found, skipping file deletion.")
         return
 
@@ -47,29 +45,27 @@ def delete_files_from_table(conn, table: str, column: str) -> None:
         return
 
     print(f"[INFO] Deleting files referenced by {table}.{column} ({len(rows)} entries)...")
-    seen = set()
+    # Deduplicate up front; sqlite3.Row supports name or index
+    wanted = {
+        resolve_path(row[column] if isinstance(row, sqlite3.Row) else row[0])
+        for row in rows
+    }
+    wanted.discard(None)
     deleted = 0
     missing = 0
 
-    for row in rows:
-        # sqlite3.Row supports name or index
-        path = row[column] if isinstance(row, sqlite3.Row) else row[0]
-        abs_path = resolve_path(path)
-        if not abs_path:
-            continue
-        if abs_path in seen:
-            continue
-        seen.add(abs_path)
-
-        if os.path.exists(abs_path):
-            try:
-                print(f"  - Deleting file: {abs_path}")
-                os.remove(abs_path)
-                deleted += 1
-            except Exception as e:
-                print(f"    ! Failed to delete {abs_path}: {e}")
-        else:
+    for abs_path in sorted(wanted):
+        # Unlink directly instead of checking existence first: one syscall
+        # per file, and no window between the check and the delete
+        try:
+            os.unlink(abs_path)
+        except FileNotFoundError:
             missing += 1
+        except OSError as e:
+            print(f"    ! Failed to delete {abs_path}: {e}")
+        else:
+            print(f"  - Deleted file: {abs_path}")
+            deleted += 1
 
     print(f"[RESULT] {deleted} file(s) deleted, {missing} missing (already gone).")
 
@@ -97,9 +93,11 @@ def main() -> None:
     conn.row_factory = sqlite3.Row
 
     try:
+        tables = get_table_names(conn)
+
         # Show current counts for information
         def count(table: str) -> int:
-            if not table_exists(conn, table):
+            if table not in tables:
                 return 0
             return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
 
@@ -117,15 +115,23 @@ def main() -> None:
             'abstract_submission_history',
             'abstract_submissions',
         ]:
-            if table_exists(conn, t):
+            if t in tables:
                 print(f"  - {t}: {count(t)}")
 
         print("\n[STEP 1] Deleting uploaded files from disk...")
-        delete_files_from_table(conn, 'abstract_submissions', 'file_path')
-        delete_files_from_table(conn, 'team_files', 'file_path')
+        delete_files_from_table(conn, tables, 'abstract_submissions', 'file_path')
+        delete_files_from_table(conn, tables, 'team_files', 'file_path')
 
         print("\n[STEP 2] Deleting database rows (events and related data)...")
+        # Pragmas must be set outside the transaction. This is a one-shot,
+        # destructive run made after a backup, so skipping fsyncs is acceptable.
+        # journal_mode is left alone: it is persistent and the app relies on WAL.
         conn.execute('PRAGMA foreign_keys = ON;')
+        conn.execute('PRAGMA synchronous = OFF;')
+        conn.execute('PRAGMA temp_store = MEMORY;')
+
+        # All deletes commit (or roll back) together
+        conn.execute('BEGIN IMMEDIATE')
 
         # Delete in dependency-safe order (children first, parents last)
         for stmt in [
@@ -146,7 +152,7 @@ def main() -> None:
             "DELETE FROM events",
         ]:
             table_name = stmt.split()[2]
-            if table_exists(conn, table_name):
+            if table_name in tables:
                 print(f"  - Executing: {stmt}")
                 conn.execute(stmt)
             else:
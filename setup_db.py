@@ -1,6 +1,92 @@
 import sqlite3
 import os
 
+SCHEMA = """
+BEGIN;
+
+-- Users table with all required columns
+CREATE TABLE users (
+    id INTEGER PRIMARY KEY,
+    username TEXT UNIQUE NOT NULL,
+    email TEXT UNIQUE NOT NULL,
+    password TEXT NOT NULL,
+    role TEXT NOT NULL CHECK (role IN ('student', 'faculty')),
+    is_verified BOOLEAN NOT NULL DEFAULT 0,
+    otp TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_login TIMESTAMP,
+    profile_picture TEXT,
+    full_name TEXT
+);
+
+-- Assignments table
+CREATE TABLE assignments (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT,
+    code TEXT UNIQUE NOT NULL,
+    faculty_id INTEGER NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    due_date TIMESTAMP,
+    max_marks INTEGER DEFAULT 100,
+    instructions TEXT,
+    is_active BOOLEAN DEFAULT 1,
+    category TEXT DEFAULT 'General',
+    FOREIGN KEY (faculty_id) REFERENCES users (id)
+);
+
+-- Submissions table
+CREATE TABLE submissions (
+    id INTEGER PRIMARY KEY,
+    content TEXT NOT NULL,
+    student_id INTEGER NOT NULL,
+    assignment_id INTEGER NOT NULL,
+    submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    file_name TEXT,
+    file_size INTEGER,
+    file_type TEXT,
+    plagiarism_score REAL DEFAULT 0.0,
+    grade INTEGER,
+    feedback TEXT,
+    status TEXT DEFAULT 'submitted' CHECK (status IN ('submitted', 'graded', 'returned')),
+    FOREIGN KEY (student_id) REFERENCES users (id),
+    FOREIGN KEY (assignment_id) REFERENCES assignments (id),
+    UNIQUE(student_id, assignment_id)
+);
+
+-- Notifications table
+CREATE TABLE notifications (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    message TEXT NOT NULL,
+    type TEXT DEFAULT 'info' CHECK (type IN ('info', 'success', 'warning', 'error')),
+    is_read BOOLEAN DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users (id)
+);
+
+-- Source docs table
+CREATE TABLE source_docs (
+    id INTEGER PRIMARY KEY,
+    content TEXT NOT NULL,
+    title TEXT,
+    author TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create indexes for performance
+CREATE INDEX idx_assignments_faculty ON assignments(faculty_id);
+CREATE INDEX idx_assignments_due_date ON assignments(due_date);
+CREATE INDEX idx_submissions_assignment_status ON submissions(assignment_id, status);
+CREATE INDEX idx_submissions_student_status ON submissions(student_id, status);
+CREATE INDEX idx_submissions_status ON submissions(status);
+CREATE INDEX idx_notifications_user ON notifications(user_id);
+CREATE INDEX idx_notifications_read ON notifications(is_read);
+
+COMMIT;
+"""
+
 # Remove existing database
 if os.path.exists('database.db'):
     os.remove('database.db')
@@ -10,97 +96,12 @@ if os.path.exists('database.db'):
 conn = sqlite3.connect('database.db')
 cursor = conn.cursor()
 
-# Users table with all required columns
-cursor.execute('''
-    CREATE TABLE users (
-        id INTEGER PRIMARY KEY,
-        username TEXT UNIQUE NOT NULL,
-        email TEXT UNIQUE NOT NULL,
-        password TEXT NOT NULL,
-        role TEXT NOT NULL CHECK (role IN ('student', 'faculty')),
-        is_verified BOOLEAN NOT NULL DEFAULT 0,
-        otp TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        last_login TIMESTAMP,
-        profile_picture TEXT,
-        full_name TEXT
-    )
-''')
-
-# Assignments table
-cursor.execute('''
-    CREATE TABLE assignments (
-        id INTEGER PRIMARY KEY,
-        title TEXT NOT NULL,
-        description TEXT,
-        code TEXT UNIQUE NOT NULL,
-        faculty_id INTEGER NOT NULL,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        due_date TIMESTAMP,
-        max_marks INTEGER DEFAULT 100,
-        instructions TEXT,
-        is_active BOOLEAN DEFAULT 1,
-        category TEXT DEFAULT 'General',
-        FOREIGN KEY (faculty_id) REFERENCES users (id)
-    )
-''')
-
-# Submissions table
-cursor.execute('''
-    CREATE TABLE submissions (
-        id INTEGER PRIMARY KEY,
-        content TEXT NOT NULL,
-        student_id INTEGER NOT NULL,
-        assignment_id INTEGER NOT NULL,
-        submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        file_name TEXT,
-        file_size INTEGER,
-        file_type TEXT,
-        plagiarism_score REAL DEFAULT 0.0,
-        grade INTEGER,
-        feedback TEXT,
-        status TEXT DEFAULT 'submitted' CHECK (status IN ('submitted', 'graded', 'returned')),
-        FOREIGN KEY (student_id) REFERENCES users (id),
-        FOREIGN KEY (assignment_id) REFERENCES assignments (id),
-        UNIQUE(student_id, assignment_id)
-    )
-''')
-
-# Notifications table
-cursor.execute('''
-    CREATE TABLE notifications (
-        id INTEGER PRIMARY KEY,
-        user_id INTEGER NOT NULL,
-        title TEXT NOT NULL,
-        message TEXT NOT NULL,
-        type TEXT DEFAULT 'info' CHECK (type IN ('info', 'success', 'warning', 'error')),
-        is_read BOOLEAN DEFAULT 0,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (user_id) REFERENCES users (id)
-    )
-''')
-
-# Source docs table
-cursor.execute('''
-    CREATE TABLE source_docs (
-        id INTEGER PRIMARY KEY,
-        content TEXT NOT NULL,
-        title TEXT,
-        author TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )
-''')
-
-# Create indexes for performance
-cursor.execute('CREATE INDEX idx_assignments_faculty ON assignments(faculty_id)')
-cursor.execute('CREATE INDEX idx_assignments_due_date ON assignments(due_date)')
-cursor.execute('CREATE INDEX idx_submissions_assignment ON submissions(assignment_id)')
-cursor.execute('CREATE INDEX idx_submissions_student ON submissions(student_id)')
-cursor.execute('CREATE INDEX idx_submissions_status ON submissions(status)')
-cursor.execute('CREATE INDEX idx_notifications_user ON notifications(user_id)')
-cursor.execute('CREATE INDEX idx_notifications_read ON notifications(is_read)')
-
-conn.commit()
+# page_size only takes effect before the first table is created
+conn.execute('PRAGMA page_size=4096')
+conn.execute('PRAGMA journal_mode=WAL').fetchone()
+
+# Whole schema in one script and one transaction
+cursor.executescript(SCHEMA)
 
 # Verify schema
 print("Database created successfully!")
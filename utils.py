@@ -1,8 +1,14 @@
-from functools import wraps
+from functools import wraps, lru_cache
 from flask import request, redirect, flash, current_app
 import sqlite3
+import threading
 import os
 
+# One connection per thread, kept open between operations
+_TLS = threading.local()
+
+_ALLOWED_EXTS = frozenset({'png', 'jpg', 'jpeg', 'gif'})
+
 
 def validate_input(required_fields):
     def decorator(function):
@@ -18,28 +24,43 @@ def validate_input(required_fields):
 
 
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in {'png', 'jpg', 'jpeg', 'gif'}
+    if '.' not in filename:
+        return False
+    return filename.rsplit('.', 1)[-1].lower() in _ALLOWED_EXTS
+
+
+def _get_conn():
+    conn = getattr(_TLS, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect('instance/campusconnect.db')
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        _TLS.conn = conn
+    return conn
 
 
 def safe_db_operation(operation_func, *args, **kwargs):
     """
     Safely execute database operations with proper connection management
     """
-    conn = None
+    conn = _get_conn()
     try:
-        conn = sqlite3.connect('instance/campusconnect.db')
-        conn.row_factory = sqlite3.Row
         result = operation_func(conn, *args, **kwargs)
         conn.commit()
         return result
     except Exception as e:
-        if conn:
-            conn.rollback()
+        conn.rollback()
         current_app.logger.error(f"Database operation failed: {str(e)}")
         raise
-    finally:
-        if conn:
-            conn.close()
+
+
+# Only successful calls are cached; a failure raises and is retried next time
+@lru_cache(maxsize=None)
+def _make_upload_directories(base_path, subdirs):
+    os.makedirs(base_path, exist_ok=True)
+    for subdir in subdirs:
+        path = os.path.join(base_path, subdir)
+        os.makedirs(path, exist_ok=True)
 
 
 def create_upload_directories(base_path, *subdirs):
@@ -47,10 +68,7 @@ def create_upload_directories(base_path, *subdirs):
     Create upload directories if they don't exist
     """
     try:
-        os.makedirs(base_path, exist_ok=True)
-        for subdir in subdirs:
-            path = os.path.join(base_path, subdir)
-            os.makedirs(path, exist_ok=True)
+        _make_upload_directories(base_path, subdirs)
         return True
     except Exception as e:
         current_app.logger.error(f"Error creating directories: {str(e)}")
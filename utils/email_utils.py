@@ -1,36 +1,82 @@
 import os
 import smtplib
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from email.message import EmailMessage
 from flask import current_app
 
-def send_email(to_email, otp_code):
-    """
-    Send OTP email with proper error handling
-    """
-    try:
-        msg = EmailMessage()
-        msg['Subject'] = 'Your OTP Code'
-        msg['From'] = current_app.config.get('MAIL_USERNAME')
-        msg['To'] = to_email
-        
-        # Email body
-        body = f"""
+SMTP_HOST = 'smtp.gmail.com'
+SMTP_PORT = 465
+# Fail fast instead of hanging a request on an unresponsive server
+SMTP_TIMEOUT = 10
+
+# Bulk sends run here so routes don't wait on them
+_EMAIL_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='smtp')
+
+# Email body; only the code changes between recipients
+_OTP_BODY = """
         <h2>Your OTP Code</h2>
-        <p>Your one-time password (OTP) is: <strong>{otp_code}</strong></p>
+        <p>Your one-time password (OTP) is: <strong>{}</strong></p>
         <p>This code will expire in 10 minutes.</p>
         <p>If you didn't request this, please ignore this email.</p>
         """
-        
-        msg.set_content(body, subtype='html')
-        
-        with smtplib.SMTP_SSL('smtp.gmail.com', 465) as smtp:
-            smtp.login(
-                current_app.config.get('MAIL_USERNAME'),
-                current_app.config.get('MAIL_PASSWORD')
-            )
-            smtp.send_message(msg)
-            
-        return True
+
+@contextlib.contextmanager
+def smtp_session():
+    """
+    Open one logged-in SMTP connection, closed when the block exits
+    """
+    with smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT) as smtp:
+        smtp.login(
+            current_app.config.get('MAIL_USERNAME'),
+            current_app.config.get('MAIL_PASSWORD')
+        )
+        yield smtp
+
+def _build_otp_message(sender, to_email, otp_code):
+    msg = EmailMessage()
+    msg['Subject'] = 'Your OTP Code'
+    msg['From'] = sender
+    msg['To'] = to_email
+    msg.set_content(_OTP_BODY.format(otp_code), subtype='html')
+    return msg
+
+def send_bulk(pairs):
+    """
+    Send OTP emails for (to_email, otp_code) pairs over a single SMTP session,
+    so the TLS handshake and login are paid once. Returns the number sent.
+    """
+    sent = 0
+    sender = current_app.config.get('MAIL_USERNAME')
+    try:
+        with smtp_session() as smtp:
+            for to_email, otp_code in pairs:
+                try:
+                    smtp.send_message(_build_otp_message(sender, to_email, otp_code))
+                    sent += 1
+                except smtplib.SMTPRecipientsRefused as e:
+                    # A bad address shouldn't stop the rest of the batch
+                    current_app.logger.error(f"Error sending email to {to_email}: {str(e)}")
     except Exception as e:
         current_app.logger.error(f"Error sending email: {str(e)}")
-        return False
+    return sent
+
+def _send_bulk_in_context(app, pairs):
+    with app.app_context():
+        return send_bulk(pairs)
+
+def queue_bulk(pairs):
+    """
+    Send a batch of OTP emails on the background SMTP pool.
+    Returns a Future resolving to the number sent.
+    """
+    app = current_app._get_current_object()
+    return _EMAIL_POOL.submit(_send_bulk_in_context, app, list(pairs))
+
+def send_email(to_email, otp_code):
+    """
+    Send OTP email with proper error handling.
+    Sent synchronously (bounded by SMTP_TIMEOUT) so callers get the delivery
+    result and can fall back when it fails.
+    """
+    return send_bulk([(to_email, otp_code)]) == 1
@@ -3,7 +3,10 @@ Event validation utilities for the CampusConnect application.
 Handles all business logic validations for event registration and management.
 """
 from datetime import datetime
+import functools
+import io
 import os
+import re
 from werkzeug.utils import secure_filename
 from models import get_db_connection
 
@@ -11,76 +14,150 @@ class EventValidationError(Exception):
     """Custom exception for event validation errors"""
     pass
 
-def validate_event_registration(user_id, event_id):
+# Templates for the parametric failure messages, formatted only on failure
+_MSG_IN_TEAM = "You are already part of team '%s' for this event."
+_MSG_MAX_TEAM = "Maximum team size for this event is %s."
+_MSG_FILE_TYPE = "Invalid file type. Allowed types: %s"
+_MSG_FILE_SIZE = "File too large. Maximum size: %sMB"
+_MSG_TOO_SHORT = "Abstract too short. Minimum %s words required."
+_MSG_TOO_LONG = "Abstract too long. Maximum %s words allowed."
+
+# Validator queries as fixed SQL strings, so repeat calls hit the
+# connection's statement cache instead of being re-parsed
+SQL_REGISTRATION_CHECK = """
+    SELECT e.is_team_event, e.registration_deadline,
+           EXISTS(SELECT 1 FROM event_registrations
+                  WHERE user_id = ? AND event_id = e.id) AS already_registered,
+           (SELECT t.name FROM teams t
+            JOIN team_members tm ON t.id = tm.team_id
+            WHERE t.event_id = e.id AND tm.user_id = ? AND tm.status = 'active'
+            LIMIT 1) AS team_name
+    FROM events e
+    WHERE e.id = ?"""
+SQL_TEAM_EVENT = "SELECT max_team_size FROM events WHERE id = ? AND is_team_event = 1"
+SQL_ACTIVE_TEAM_NAME = """
+    SELECT t.name FROM teams t
+    JOIN team_members tm ON t.id = tm.team_id
+    WHERE t.event_id = ? AND tm.user_id = ? AND tm.status = 'active'
+    LIMIT 1"""
+# Defaults for events without requirements are filled in by the query
+SQL_TEAM_REQUIREMENTS = """
+    SELECT COALESCE(er.requires_abstract, 0) AS requires_abstract,
+           COALESCE(NULLIF(er.allowed_file_types, ''), 'pdf,docx,txt') AS allowed_file_types,
+           COALESCE(er.max_file_size_mb, 5) AS max_file_size_mb,
+           COALESCE(er.abstract_min_words, 150) AS abstract_min_words,
+           COALESCE(er.abstract_max_words, 500) AS abstract_max_words
+    FROM teams t
+    LEFT JOIN event_requirements er ON t.event_id = er.event_id
+    WHERE t.id = ?"""
+
+@functools.lru_cache(maxsize=1024)
+def _parse_deadline(reg_deadline):
+    """Parse a stored deadline string, or None if it can't be parsed"""
+    # Stored as text in SQLite (e.g. 'YYYY-MM-DD HH:MM:SS'), which
+    # fromisoformat parses directly
+    try:
+        return datetime.fromisoformat(reg_deadline)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(reg_deadline.replace('Z', '+00:00'))
+    except ValueError:
+        pass
+    # strptime also accepts non-padded fields such as '2024-3-5 9:05:00'
+    try:
+        return datetime.strptime(reg_deadline, '%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return None
+
+_WORD_RE = re.compile(r'\S+')
+# Extensions that could ever be allowed are short and alphanumeric
+_EXT_RE = re.compile(r'\.([A-Za-z0-9]{1,10})$')
+
+def _count_words_bounded(text, cap):
+    """
+    Whitespace-separated word count, without building the split list.
+    Stops at cap + 1, which is enough to know the text is over the limit.
+    """
+    count = 0
+    for _ in _WORD_RE.finditer(text):
+        count += 1
+        if count > cap:
+            break
+    return count
+
+@functools.lru_cache(maxsize=256)
+def _allowed_exts(allowed_types):
+    """Set of allowed extensions for an event's allowed_file_types string"""
+    return frozenset(allowed_types.lower().split(','))
+
+def _upload_size(file):
+    """
+    Size in bytes of an uploaded file, taken from its buffer or descriptor
+    when possible so the stream position is left alone
+    """
+    stream = getattr(file, 'stream', file)
+    if isinstance(stream, io.BytesIO):
+        return stream.getbuffer().nbytes
+    try:
+        return os.fstat(stream.fileno()).st_size
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+    file.seek(0, os.SEEK_END)
+    size = file.tell()
+    file.seek(0)
+    return size
+
+def validate_event_registration(user_id, event_id, now=None):
     """
     Validate if a user can register for an event
     
     Args:
         user_id (int): ID of the user attempting to register
         event_id (int): ID of the event to register for
+        now (datetime, optional): Current time, so callers validating in a
+            batch can share one timestamp; defaults to datetime.now()
         
     Returns:
         tuple: (is_valid, message)
     """
+    # Shared per-context connection; not closed here, since close() rolls back
+    # and would discard a caller's uncommitted work on the same connection
     conn = get_db_connection()
     try:
-        # Check if event exists and is open for registration
+        # Check if event exists and is open for registration; the existing
+        # registration and active team are fetched in the same round-trip
         event = conn.execute(
-            """SELECT e.*, er.* 
-               FROM events e 
-               LEFT JOIN event_requirements er ON e.id = er.event_id 
-               WHERE e.id = ?""", 
-            (event_id,)
+            SQL_REGISTRATION_CHECK,
+            (user_id, user_id, event_id)
         ).fetchone()
         
         if not event:
             return False, "Event not found."
             
+        # Check if user is already registered, before any date parsing
+        if event['already_registered']:
+            return False, "You are already registered for this event."
+            
         # Check if registration deadline has passed
         if event['registration_deadline']:
             reg_deadline = event['registration_deadline']
-            try:
-                if isinstance(reg_deadline, str):
-                    # Stored as text in SQLite (e.g. 'YYYY-MM-DD HH:MM:SS')
-                    try:
-                        reg_deadline_dt = datetime.strptime(reg_deadline, '%Y-%m-%d %H:%M:%S')
-                    except ValueError:
-                        reg_deadline_dt = datetime.fromisoformat(reg_deadline.replace('Z', '+00:00'))
-                else:
-                    reg_deadline_dt = reg_deadline
-            except Exception:
-                reg_deadline_dt = None
+            if isinstance(reg_deadline, str):
+                reg_deadline_dt = _parse_deadline(reg_deadline)
+            else:
+                reg_deadline_dt = reg_deadline
 
-            if reg_deadline_dt and reg_deadline_dt < datetime.now():
+            if reg_deadline_dt and reg_deadline_dt < (now or datetime.now()):
                 return False, "Registration deadline has passed."
             
-        # Check if user is already registered
-        existing_reg = conn.execute(
-            "SELECT * FROM event_registrations WHERE user_id = ? AND event_id = ?",
-            (user_id, event_id)
-        ).fetchone()
-        
-        if existing_reg:
-            return False, "You are already registered for this event."
-            
         # If team event, check if user is already in a team
-        if event['is_team_event']:
-            team_member = conn.execute(
-                """SELECT t.* FROM teams t 
-                   JOIN team_members tm ON t.id = tm.team_id 
-                   WHERE t.event_id = ? AND tm.user_id = ? AND tm.status = 'active'""",
-                (event_id, user_id)
-            ).fetchone()
-            
-            if team_member:
-                return False, f"You are already part of team '{team_member['name']}' for this event."
+        if event['is_team_event'] and event['team_name'] is not None:
+            return False, _MSG_IN_TEAM % event['team_name']
         
         return True, ""
         
     except Exception as e:
         return False, f"Validation error: {str(e)}"
-    finally:
-        conn.close()
 
 def validate_team_creation(user_id, event_id, team_data):
     """
@@ -94,11 +171,15 @@ def validate_team_creation(user_id, event_id, team_data):
     Returns:
         tuple: (is_valid, message)
     """
+    # Validate team name before any database work
+    if not team_data.get('name') or len(team_data['name']) < 3:
+        return False, "Team name must be at least 3 characters long."
+
     conn = get_db_connection()
     try:
         # Check if event exists and allows teams
         event = conn.execute(
-            "SELECT * FROM events WHERE id = ? AND is_team_event = 1",
+            SQL_TEAM_EVENT,
             (event_id,)
         ).fetchone()
         
@@ -107,30 +188,22 @@ def validate_team_creation(user_id, event_id, team_data):
             
         # Check if user is already in a team for this event
         existing_team = conn.execute(
-            """SELECT t.* FROM teams t 
-               JOIN team_members tm ON t.id = tm.team_id 
-               WHERE t.event_id = ? AND tm.user_id = ? AND tm.status = 'active'""",
+            SQL_ACTIVE_TEAM_NAME,
             (event_id, user_id)
         ).fetchone()
         
         if existing_team:
-            return False, f"You are already part of team '{existing_team['name']}' for this event."
-            
-        # Validate team name
-        if not team_data.get('name') or len(team_data['name']) < 3:
-            return False, "Team name must be at least 3 characters long."
+            return False, _MSG_IN_TEAM % existing_team['name']
             
         # Validate team size
         max_team_size = team_data.get('max_members', event['max_team_size'])
         if max_team_size > event['max_team_size']:
-            return False, f"Maximum team size for this event is {event['max_team_size']}."
+            return False, _MSG_MAX_TEAM % event['max_team_size']
             
         return True, ""
         
     except Exception as e:
         return False, f"Validation error: {str(e)}"
-    finally:
-        conn.close()
 
 def validate_abstract_submission(team_id, file=None, text=None):
     """
@@ -148,11 +221,7 @@ def validate_abstract_submission(team_id, file=None, text=None):
     try:
         # Get team and event requirements
         team = conn.execute(
-            """SELECT t.*, er.* 
-               FROM teams t 
-               LEFT JOIN events e ON t.event_id = e.id 
-               LEFT JOIN event_requirements er ON e.id = er.event_id 
-               WHERE t.id = ?""",
+            SQL_TEAM_REQUIREMENTS,
             (team_id,)
         ).fetchone()
         
@@ -160,9 +229,7 @@ def validate_abstract_submission(team_id, file=None, text=None):
             return False, "Team not found.", 0, None
             
         # Determine abstract-related settings from requirements
-        requires_abstract = bool(
-            'requires_abstract' in team.keys() and team['requires_abstract']
-        )
+        requires_abstract = bool(team['requires_abstract'])
         if not requires_abstract:
             return False, "This event does not require an abstract.", 0, None
             
@@ -170,30 +237,22 @@ def validate_abstract_submission(team_id, file=None, text=None):
         file_info = None
         if file:
             # Validate file type
-            allowed_types = (
-                team['allowed_file_types']
-                if 'allowed_file_types' in team.keys() and team['allowed_file_types']
-                else 'pdf,docx,txt'
-            )
-            allowed_extensions = allowed_types.lower().split(',')
+            allowed_types = team['allowed_file_types']
+            allowed_extensions = _allowed_exts(allowed_types)
             filename = secure_filename(file.filename)
-            file_ext = filename.rsplit('.', 1)[1].lower() if '.' in filename else ''
+            match = _EXT_RE.search(filename)
+            file_ext = match.group(1).lower() if match else ''
             
             if file_ext not in allowed_extensions:
-                return False, f"Invalid file type. Allowed types: {', '.join(allowed_extensions)}", 0, None
+                # Listed in the configured order, not the set's
+                return False, _MSG_FILE_TYPE % ', '.join(allowed_types.lower().split(',')), 0, None
                 
             # Validate file size (in MB)
-            max_size_mb = (
-                team['max_file_size_mb']
-                if 'max_file_size_mb' in team.keys() and team['max_file_size_mb'] is not None
-                else 5
-            )
-            file.seek(0, os.SEEK_END)
-            file_size_mb = file.tell() / (1024 * 1024)
-            file.seek(0)
+            max_size_mb = team['max_file_size_mb']
+            file_size_mb = _upload_size(file) / (1024 * 1024)
             
             if file_size_mb > max_size_mb:
-                return False, f"File too large. Maximum size: {max_size_mb}MB", 0, None
+                return False, _MSG_FILE_SIZE % max_size_mb, 0, None
                 
             file_info = {
                 'filename': filename,
@@ -204,27 +263,17 @@ def validate_abstract_submission(team_id, file=None, text=None):
         # Validate text if provided
         word_count = 0
         if text:
-            word_count = len(text.split())
-            min_words = (
-                team['abstract_min_words']
-                if 'abstract_min_words' in team.keys() and team['abstract_min_words'] is not None
-                else 150
-            )
-            max_words = (
-                team['abstract_max_words']
-                if 'abstract_max_words' in team.keys() and team['abstract_max_words'] is not None
-                else 500
-            )
+            min_words = team['abstract_min_words']
+            max_words = team['abstract_max_words']
+            word_count = _count_words_bounded(text, max_words)
             
             if word_count < min_words:
-                return False, f"Abstract too short. Minimum {min_words} words required.", word_count, file_info
+                return False, _MSG_TOO_SHORT % min_words, word_count, file_info
                 
             if word_count > max_words:
-                return False, f"Abstract too long. Maximum {max_words} words allowed.", word_count, file_info
+                return False, _MSG_TOO_LONG % max_words, word_count, file_info
         
         return True, "", word_count, file_info
         
     except Exception as e:
         return False, f"Validation error: {str(e)}", 0, None
-    finally:
-        conn.close()